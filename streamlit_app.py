@@ -18,7 +18,9 @@ st.write(
 # reruns (e.g. if the user interacts with the widgets).
 @st.cache_data
 def load_data():
-    df = pd.read_csv("data/movies_genres_summary.csv")
+    df = pd.read_csv(
+        "data/movies_genres_summary.csv", usecols=["year", "gross", "genre"]
+    )
     return df
 
 
@@ -36,6 +38,12 @@ years = st.slider("Years", 1986, 2006, (2000, 2016))
 
 # Filter the dataframe based on the widget input and reshape it.
 df_filtered = df[(df["genre"].isin(genres)) & (df["year"].between(years[0], years[1]))]
+
+# Nothing to pivot or plot if the filters leave no rows, so stop the script early.
+if df_filtered.empty:
+    st.info("No data for the selected genres and years.")
+    st.stop()
+
 df_reshaped = df_filtered.pivot_table(
     index="year", columns="genre", values="gross", aggfunc="sum", fill_value=0
 )